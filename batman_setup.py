@@ -19,9 +19,12 @@ PYPI_LIBS = [
     "opencv-python",
     "numpy",
     "pandas",
-    "skyfield"
+    "skyfield",
+    "numba"
 ]
 
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "--prefer-binary", "--no-input"]
+
 def run_cmd(cmd_list):
     try:
         subprocess.run(cmd_list, check=True)
@@ -30,19 +33,21 @@ def run_cmd(cmd_list):
 
 def install_local_libs():
     print("\n--- Installing local libraries ---\n")
+    paths = []
     for lib in LOCAL_LIBS:
         path = os.path.join(LIB_DIR, lib)
         if os.path.exists(path):
-            print(f"Installing {lib} ...")
-            run_cmd([sys.executable, "-m", "pip", "install", path])
+            paths.append(path)
         else:
             print(f"⚠️ Library not found: {path}")
+    if paths:
+        print(f"Installing {', '.join(os.path.basename(p) for p in paths)} ...")
+        run_cmd(PIP_INSTALL + paths)
 
 def install_pypi_libs():
     print("\n--- Installing PyPI libraries ---\n")
-    for lib in PYPI_LIBS:
-        print(f"Installing {lib} ...")
-        run_cmd([sys.executable, "-m", "pip", "install", lib])
+    print(f"Installing {', '.join(PYPI_LIBS)} ...")
+    run_cmd(PIP_INSTALL + PYPI_LIBS)
 
 def test_installation():
     print("\n--- Testing pyswisseph ---")
@@ -0,0 +1,44 @@
+"""Plain-Python angle helpers shared by the scalar and batch chart paths.
+
+This module must not import Numba: the single-chart pipeline uses these
+functions directly, and :mod:`astro._kernels` compiles the very same
+definitions for the batch path, so the formula exists exactly once.
+"""
+
+from __future__ import annotations
+
+import math
+
+__all__ = ["DEGREES_PER_CIRCLE", "ascendant_degrees", "wrap_degrees"]
+
+DEGREES_PER_CIRCLE = 360.0
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+
+def wrap_degrees(angle: float) -> float:
+    """Wrap ``angle`` into ``[0, 360)`` degrees."""
+
+    # Float ``%`` is exact, unlike multiplying by a rounded 1/360 (which can
+    # return tiny negatives).  Only a negative angle smaller than half an ulp
+    # of 360 rounds up to 360 itself; fold that back onto 0.
+    wrapped = angle % DEGREES_PER_CIRCLE
+    return wrapped if wrapped < DEGREES_PER_CIRCLE else 0.0
+
+
+def ascendant_degrees(lst_deg: float, latitude_deg: float, obliquity_rad: float) -> float:
+    """Return the tropical ascendant in degrees.
+
+    ``lst_deg`` and ``latitude_deg`` are in degrees, ``obliquity_rad`` (ε) in
+    radians.  Implements ``λasc = atan2(sin(LST)·cos ε − tan φ·sin ε, cos(LST))``
+    (Meeus 1998, ch. 12).  Degree/radian conversions and the final wrap are
+    folded in so a compiled caller makes one call per chart; the signed
+    ``atan2`` result is wrapped directly, without a quadrant branch.
+    """
+
+    lst_rad = lst_deg * _DEG2RAD
+    latitude_rad = latitude_deg * _DEG2RAD
+    numerator = math.sin(lst_rad) * math.cos(obliquity_rad) - math.tan(
+        latitude_rad
+    ) * math.sin(obliquity_rad)
+    return wrap_degrees(math.atan2(numerator, math.cos(lst_rad)) * _RAD2DEG)
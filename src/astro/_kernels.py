@@ -0,0 +1,87 @@
+"""Numerical kernels for the batch chart pipeline.
+
+The scalar ascendant and wrap are the plain-Python definitions from
+:mod:`astro._angles`, compiled here together with array loops over them so that
+Numba can lower the batch path to machine code.  Numba is listed in
+``requirements.txt``; if it is missing anyway the decorators degrade to no-ops
+and the same functions run as ordinary Python, so results never depend on its
+availability.  Import this module lazily: loading Numba and compiling the
+kernels is only worth it for batches, not for a single chart.  ``fastmath`` is
+deliberately off: its reciprocal rewrite would break the ``[0, 360)`` wrap.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from astro import _angles
+
+try:
+    from numba import njit, prange
+    from numba.extending import register_jitable
+except ImportError:  # pragma: no cover - optional accelerator
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def register_jitable(func):  # type: ignore[no-redef]
+        """Stand-in for :func:`numba.extending.register_jitable`."""
+
+        return func
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for :func:`numba.njit` returning the function unchanged."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+else:
+    NUMBA_AVAILABLE = True
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "ascendant_array",
+    "ascendant_kernel",
+    "sidereal_offset_array",
+    "wrap_degrees",
+    "wrap_degrees_array",
+]
+
+# The scalar helpers are defined once, in plain Python, in ``astro._angles``.
+# Registering ``wrap_degrees`` lets the compiled ascendant call it, and the
+# same function objects are then compiled for use by the array kernels below.
+register_jitable(_angles.wrap_degrees)
+wrap_degrees = njit(cache=True)(_angles.wrap_degrees)
+ascendant_kernel = njit(cache=True)(_angles.ascendant_degrees)
+
+
+@njit(cache=True, parallel=True)
+def wrap_degrees_array(angles: np.ndarray) -> np.ndarray:
+    """Element-wise :func:`wrap_degrees` over a 1-D array."""
+
+    out = np.empty(angles.shape[0])
+    for i in prange(angles.shape[0]):
+        out[i] = wrap_degrees(angles[i])
+    return out
+
+
+@njit(cache=True, parallel=True)
+def ascendant_array(
+    lst_deg: np.ndarray, latitude_deg: np.ndarray, obliquity_rad: np.ndarray
+) -> np.ndarray:
+    """Element-wise :func:`ascendant_kernel` over aligned 1-D arrays."""
+
+    out = np.empty(lst_deg.shape[0])
+    for i in prange(lst_deg.shape[0]):
+        out[i] = ascendant_kernel(lst_deg[i], latitude_deg[i], obliquity_rad[i])
+    return out
+
+
+@njit(cache=True, parallel=True)
+def sidereal_offset_array(tropical_deg: np.ndarray, ayanamsa_deg: np.ndarray) -> np.ndarray:
+    """Subtract the ayanamsa and wrap in one fused pass (degrees)."""
+
+    out = np.empty(tropical_deg.shape[0])
+    for i in prange(tropical_deg.shape[0]):
+        out[i] = wrap_degrees(tropical_deg[i] - ayanamsa_deg[i])
+    return out
@@ -5,30 +5,46 @@ high-precision JPL Development ephemerides while keeping the rest of the code
 agnostic to the underlying provider.  The design follows the layering defined
 in ``docs/vedic_architecture.md`` where this module is part of the
 ``astro.ephemeris`` layer feeding higher level services.
+
+Skyfield and NumPy are imported lazily inside the functions that need them, so
+kernel discovery (e.g. ``tools/status.py``) does not pay their import cost.
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
 import os
-import shutil
-import tempfile
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Optional
-from urllib.error import URLError
-from urllib.request import urlopen
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, Optional, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from http.client import HTTPResponse
+    from urllib.error import URLError
 
-from skyfield.api import Loader, Time, Timescale, load_file
-from skyfield.vectorlib import VectorFunction
+    import numpy as np
+    from skyfield.api import Time, Timescale
+    from skyfield.jpllib import SpiceKernel
+    from skyfield.positionlib import Barycentric
+    from skyfield.vectorlib import VectorFunction
 
 __all__ = [
     "DEFAULT_EPHEMERIS_NAME",
+    "DEFAULT_TIME_QUANTUM_DAYS",
+    "KERNEL_REGISTRY",
     "ensure_kernel_available",
     "SKYFIELD_DATA_DIRECTORY",
     "SKYFIELD_HOME_DIRECTORY",
     "KernelAcquisitionError",
+    "NutationOfDate",
+    "clear_kernel_cache",
     "SkyfieldEphemeris",
+    "get_default_ephemeris",
+    "nutation_of_date",
 ]
 
 # ---------------------------------------------------------------------------
@@ -56,9 +72,45 @@ KERNEL_CANDIDATE_NAMES: tuple[str, ...] = (
 )
 """Preferred kernel filenames in descending accuracy order."""
 
+_STATIC_SEARCH_DIRECTORIES: tuple[Path, ...] = (
+    SKYFIELD_HOME_DIRECTORY,
+    SKYFIELD_DATA_DIRECTORY,
+)
+"""Search directories that follow any caller-supplied ones (already absolute)."""
+
 JPL_DE421_URL = "https://ssd.jpl.nasa.gov/ftp/eph/planets/bsp/de421.bsp"
 """Canonical download endpoint for the public DE421 ephemeris."""
 
+KERNEL_REGISTRY: dict[str, tuple[str, str]] = {
+    "de421.bsp": (
+        JPL_DE421_URL,
+        "sha256:a20a7139da04cbc462454634918e9a9ca69127044e2cc9d4f9c16e238d2deedc",
+    ),
+}
+"""Downloadable kernels: filename -> (URL, ``algorithm:hexdigest`` checksum)."""
+
+DOWNLOAD_KERNEL_NAME = "de421.bsp"
+"""Registry entry fetched when no kernel exists locally."""
+
+DOWNLOAD_ATTEMPTS = 3
+"""Network attempts before giving up on a kernel download."""
+
+DOWNLOAD_BACKOFF_SECONDS = 1.0
+"""Delay before the first retry; doubled for each further attempt."""
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+"""Read size (bytes) when streaming a download of unknown length."""
+
+DEFAULT_TIME_QUANTUM_DAYS = 1e-6
+"""Suggested quantum for opt-in longitude caching (1e-6 d ≈ 0.086 s)."""
+
+QUANTIZED_CACHE_SIZE = 4096
+"""Instants kept by the process-wide quantised longitude cache."""
+
+_SPK_CACHE: dict[Path, SpiceKernel] = {}
+"""Open kernels keyed by resolved path, shared by every adapter instance."""
+_SPK_CACHE_LOCK = threading.Lock()
+
 
 class KernelAcquisitionError(FileNotFoundError):
     """Raised when no suitable JPL kernel could be located or fetched."""
@@ -75,11 +127,17 @@ def ensure_kernel_available(
 
     1. Explicit :envvar:`VEDIC_EPHEMERIS_PATH` override.
     2. Extra directories supplied via ``extra_search_paths``.
-    3. User cache ``~/.skyfield`` (auto-created if missing).
+    3. User cache ``~/.skyfield`` (created on first download).
     4. Repository cache ``data/skyfield`` for offline CI scenarios.
 
-    If no kernel is found, DE421 is downloaded to ``~/.skyfield``.  A clear
-    warning is raised if the download fails (e.g. offline environment).
+    If no kernel is found, DE421 is downloaded to ``~/.skyfield`` and checked
+    against the checksum in :data:`KERNEL_REGISTRY`; once cached it is found by
+    the search above and never fetched again.  A clear warning is raised if the
+    download fails (e.g. offline environment).
+
+    Steps 2-4 are remembered per ``(preferred_name, extra_search_paths)`` for
+    the life of the process, so repeated calls touch the filesystem only once;
+    see :func:`clear_kernel_cache`.
     """
 
     env_path = os.getenv("VEDIC_EPHEMERIS_PATH")
@@ -91,23 +149,41 @@ def ensure_kernel_available(
             f"Configured ephemeris '{env_candidate}' does not exist."
         )
 
-    search_directories: list[Path] = []
+    extra = tuple(str(p) for p in extra_search_paths) if extra_search_paths else ()
+    return _locate_kernel(preferred_name, extra)
+
+
+def clear_kernel_cache() -> None:
+    """Forget kernel locations remembered by :func:`ensure_kernel_available`.
+
+    Call this after adding, moving or deleting kernel files in a running
+    process (e.g. between tests) so the next lookup searches the disk again.
+    """
+
+    _locate_kernel.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _locate_kernel(preferred_name: str, extra_search_paths: tuple[str, ...]) -> str:
+    """Search (and if necessary download) a kernel; memoised per argument set."""
+
+    search_directories = _STATIC_SEARCH_DIRECTORIES
     if extra_search_paths:
-        search_directories.extend(Path(p).expanduser() for p in extra_search_paths)
-    search_directories.append(SKYFIELD_HOME_DIRECTORY)
-    search_directories.append(SKYFIELD_DATA_DIRECTORY)
+        search_directories = (
+            tuple(Path(p).expanduser() for p in extra_search_paths)
+            + _STATIC_SEARCH_DIRECTORIES
+        )
 
     search_names = _candidate_names(preferred_name)
     for directory in search_directories:
-        if directory == SKYFIELD_HOME_DIRECTORY:
-            directory.mkdir(parents=True, exist_ok=True)
         candidate = _find_kernel_in_directory(directory, search_names)
         if candidate is not None:
             return str(candidate)
 
-    download_target = SKYFIELD_HOME_DIRECTORY / "de421.bsp"
+    url, known_hash = KERNEL_REGISTRY[DOWNLOAD_KERNEL_NAME]
+    download_target = SKYFIELD_HOME_DIRECTORY / DOWNLOAD_KERNEL_NAME
     try:
-        _download_kernel(JPL_DE421_URL, download_target)
+        downloaded = _download_kernel(url, download_target, known_hash=known_hash)
     except KernelAcquisitionError:
         raise
     except Exception as exc:  # pragma: no cover - defensive
@@ -115,7 +191,8 @@ def ensure_kernel_available(
             f"Failed to download ephemeris: {exc}"
         ) from exc
 
-    print("[auto] Downloaded de421.bsp to ~/.skyfield/")
+    if downloaded:
+        print("[auto] Downloaded de421.bsp to ~/.skyfield/")
     return str(download_target.resolve())
 
 
@@ -128,6 +205,72 @@ class EphemerisBodies:
     moon: VectorFunction
 
 
+@dataclass(frozen=True)
+class NutationOfDate:
+    """Nutation-dependent quantities for one ``Time`` (radians unless noted).
+
+    Built once per instant by :func:`nutation_of_date` so the ecliptic frame,
+    the true obliquity and the apparent sidereal time share a single IAU 2000A
+    series evaluation.
+    """
+
+    mean_obliquity_rad: float
+    delta_psi_rad: float
+    delta_epsilon_rad: float
+    gast_hours: float
+    """Greenwich apparent sidereal time in hours, ``[0, 24)``."""
+    ecliptic_matrix: np.ndarray
+    """Rotation ICRS → true ecliptic and equinox of date."""
+
+    @property
+    def true_obliquity_rad(self) -> float:
+        return self.mean_obliquity_rad + self.delta_epsilon_rad
+
+
+def nutation_of_date(time: Time) -> NutationOfDate:
+    """Evaluate nutation and obliquity for ``time`` using Skyfield's public API.
+
+    Mirrors the quantities Skyfield derives internally for ``Time.gast`` and
+    the ``ecliptic_frame`` (IERS Conventions 2010): ``R = Rx(−ε)·N·P·B`` with
+    ``N`` the IAU 2000A nutation, ``P`` the IAU 2006 precession and ``B`` the
+    ICRS frame bias.  Works for scalar and array-valued ``Time`` alike.
+    """
+
+    import numpy as np
+    from skyfield.constants import ASEC2RAD, tau
+    from skyfield.framelib import ICRS_to_J2000
+    from skyfield.functions import mxm, mxmxm, rot_x
+    from skyfield.nutationlib import (
+        build_nutation_matrix,
+        equation_of_the_equinoxes_complimentary_terms,
+        iau2000a_radians,
+        mean_obliquity,
+    )
+    from skyfield.precessionlib import compute_precession
+
+    delta_psi, delta_epsilon = iau2000a_radians(time)
+    mean_eps = mean_obliquity(time.tdb) * ASEC2RAD
+    true_eps = mean_eps + delta_epsilon
+
+    c_terms = equation_of_the_equinoxes_complimentary_terms(time.tt)
+    equation_of_equinoxes = delta_psi * np.cos(mean_eps) + c_terms
+    gast_hours = (time.gmst + equation_of_equinoxes / tau * 24.0) % 24.0
+
+    nutation = build_nutation_matrix(mean_eps, true_eps, delta_psi)
+    precession = compute_precession(time.tdb)
+    ecliptic_matrix = mxm(
+        rot_x(-true_eps), mxmxm(nutation, precession, ICRS_to_J2000)
+    )
+
+    return NutationOfDate(
+        mean_obliquity_rad=mean_eps,
+        delta_psi_rad=delta_psi,
+        delta_epsilon_rad=delta_epsilon,
+        gast_hours=gast_hours,
+        ecliptic_matrix=ecliptic_matrix,
+    )
+
+
 class SkyfieldEphemeris:
     """Adapter that exposes the subset of ephemeris functionality we need.
 
@@ -138,26 +281,41 @@ class SkyfieldEphemeris:
     ephemeris_name:
         Name of the Skyfield ephemeris file to load when an explicit path is
         not provided via :envvar:`VEDIC_EPHEMERIS_PATH`.
+    time_quantum_days:
+        Opt-in tolerance for reusing apparent longitudes across nearby
+        instants.  When set (e.g. :data:`DEFAULT_TIME_QUANTUM_DAYS`), scalar
+        times are rounded to this many TT days and results are served from a
+        process-wide LRU cache shared by all threads.  Only suitable for
+        callers that accept the resulting loss of precision; disabled by
+        default.
     """
 
     def __init__(
         self,
         data_directory: Optional[Path] = None,
         ephemeris_name: str = DEFAULT_EPHEMERIS_NAME,
+        *,
+        time_quantum_days: Optional[float] = None,
     ) -> None:
+        if time_quantum_days is not None and time_quantum_days <= 0.0:
+            raise ValueError("time_quantum_days must be positive")
         kernel_path = self._resolve_kernel_path(
             ephemeris_name, data_directory=data_directory
         )
+        self._kernel_path = kernel_path
+        self._time_quantum_days = time_quantum_days
         self._data_directory = kernel_path.parent
-        self._loader = Loader(str(self._data_directory))
-        self._timescale = self._loader.timescale()
+        self._timescale = _load_timescale(str(self._data_directory))
 
-        self._ephemeris = load_file(str(kernel_path))
+        self._ephemeris = _load_kernel(kernel_path)
         self._bodies = EphemerisBodies(
             earth=self._ephemeris["earth"],
             sun=self._ephemeris["sun"],
             moon=self._ephemeris["moon"],
         )
+        # Single-slot cache of Earth's barycentric state for the last scalar
+        # Time observed, so several bodies at the same instant share one solve.
+        self._earth_at_cache: Optional[tuple[Time, Barycentric]] = None
 
     @property
     def bodies(self) -> EphemerisBodies:
@@ -180,16 +338,23 @@ class SkyfieldEphemeris:
         dt_utc = dt.astimezone(timezone.utc)
         return self._timescale.from_datetime(dt_utc)
 
+    def to_times(self, dts: Iterable[datetime]) -> Time:
+        """Convert timezone-aware datetimes into one array-valued ``Time``."""
+
+        dts_utc = []
+        for dt in dts:
+            if dt.tzinfo is None:
+                raise ValueError("datetime must be timezone aware")
+            dts_utc.append(dt.astimezone(timezone.utc))
+        return self._timescale.from_datetimes(dts_utc)
+
     def _resolve_kernel_path(
         self,
         ephemeris_name: str,
         *,
         data_directory: Optional[Path],
     ) -> Path:
-        extra_paths: list[Path] = []
-        if data_directory is not None:
-            extra_paths.append(Path(data_directory))
-
+        extra_paths = (data_directory,) if data_directory is not None else None
         kernel_path = ensure_kernel_available(
             ephemeris_name, extra_search_paths=extra_paths
         )
@@ -206,24 +371,163 @@ class SkyfieldEphemeris:
             Skyfield ``Time`` instance; computations are referenced to TT/TDB.
         """
 
+        return self.ecliptic_longitudes((body,), time)[body]
+
+    def ecliptic_longitudes(
+        self,
+        bodies: Iterable[str],
+        time: Time,
+        *,
+        nutation: Optional[NutationOfDate] = None,
+    ) -> dict[str, float]:
+        """Return true ecliptic longitudes (degrees) for several bodies.
+
+        Earth's barycentric position is computed once per ``time`` and shared
+        by every observation, and all apparent positions are rotated into the
+        ecliptic of date with a single matrix product.  ``time`` may also be an
+        array-valued Skyfield ``Time``, in which case each value is a NumPy
+        array of longitudes.  Supplying a precomputed ``nutation`` for the same
+        ``time`` reuses its ecliptic-of-date rotation.
+
+        With ``time_quantum_days`` configured, scalar times are answered from
+        the quantised cache and ``nutation`` is not consulted.
+        """
+
+        names = tuple(bodies)
+        targets = [self._target(name) for name in names]
+        quantum = self._time_quantum_days
+        if quantum is not None and time.shape == ():
+            step = round(time.tt / quantum)
+            return {
+                name: _quantized_ecliptic_longitude(
+                    self._kernel_path, name, quantum, step
+                )
+                for name in names
+            }
+        if nutation is not None:
+            rotation = nutation.ecliptic_matrix
+        else:
+            from skyfield.framelib import ecliptic_frame
+
+            rotation = ecliptic_frame.rotation_at(time)
+        _, longitudes = _ecliptic_latlon_degrees(
+            self._earth_at(time), targets, rotation
+        )
+        return dict(zip(names, longitudes))
+
+    def _target(self, body: str) -> VectorFunction:
         try:
-            target = getattr(self._bodies, body)
-        except AttributeError as exc:  # pragma: no cover - defensive branch
+            return getattr(self._bodies, body)
+        except AttributeError as exc:
             raise ValueError(f"Body '{body}' is not available in the ephemeris") from exc
-        lat, lon = _ecliptic_latlon_degrees(self._bodies.earth, target, time)
-        return lon
+
+    def _earth_at(self, time: Time) -> Barycentric:
+        cached = self._earth_at_cache
+        if cached is not None and cached[0] is time:
+            return cached[1]
+        earth_at = self._bodies.earth.at(time)
+        # Array-valued batches are not kept: on the shared default instance
+        # they would pin large position/velocity arrays until the next call.
+        if time.shape == ():
+            self._earth_at_cache = (time, earth_at)
+        return earth_at
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_ephemeris() -> SkyfieldEphemeris:
+    """Return the process-wide :class:`SkyfieldEphemeris` built with defaults.
+
+    Constructing an adapter resolves and opens the kernel and builds a
+    ``Timescale``; callers that do not need a custom configuration should
+    share this instance instead of paying that cost on every computation.
+    """
+
+    return SkyfieldEphemeris()
+
+
+def _load_kernel(kernel_path: Path) -> SpiceKernel:
+    """Return the shared SPK reader for ``kernel_path``, opening it on first use.
+
+    Kernels are read-only and jplephem memory-maps their segments, so one
+    reader per file can safely serve every adapter and thread.
+    """
+
+    from skyfield.api import load_file
+
+    with _SPK_CACHE_LOCK:
+        kernel = _SPK_CACHE.get(kernel_path)
+        if kernel is None:
+            kernel = _SPK_CACHE[kernel_path] = load_file(str(kernel_path))
+        return kernel
+
+
+@functools.lru_cache(maxsize=QUANTIZED_CACHE_SIZE)
+def _quantized_ecliptic_longitude(
+    kernel_path: Path, body: str, quantum: float, step: int
+) -> float:
+    """Longitude of ``body`` at TT ``step * quantum``, memoised process-wide.
+
+    Positions are evaluated at the quantised instant itself, so every caller
+    landing in the same bucket gets identical values regardless of which
+    request populated the cache.  Entries are keyed per body, so a lookup for
+    one body reuses whatever an earlier multi-body call already computed.
+    """
+
+    earth_at, rotation = _quantized_frame(kernel_path, quantum, step)
+    _, longitudes = _ecliptic_latlon_degrees(
+        earth_at, [_load_kernel(kernel_path)[body]], rotation
+    )
+    return float(longitudes[0])
+
+
+@functools.lru_cache(maxsize=16)
+def _quantized_frame(
+    kernel_path: Path, quantum: float, step: int
+) -> tuple[Barycentric, np.ndarray]:
+    """Earth's state and the ecliptic rotation at TT ``step * quantum``.
+
+    Shared by the per-body entries of one instant; only the last few instants
+    are kept since the bodies of a chart are looked up back to back.
+    """
+
+    kernel = _load_kernel(kernel_path)
+    timescale = _load_timescale(str(kernel_path.parent))
+    time = timescale.tt_jd(step * quantum)
+    return kernel["earth"].at(time), nutation_of_date(time).ecliptic_matrix
+
+
+@functools.lru_cache(maxsize=None)
+def _load_timescale(data_directory: str) -> Timescale:
+    """Build (once per directory) the Skyfield ``Timescale`` for ``data_directory``."""
+
+    from skyfield.api import Loader
+
+    return Loader(data_directory).timescale()
 
 
 def _ecliptic_latlon_degrees(
-    earth: VectorFunction, target: VectorFunction, time: Time
-) -> tuple[float, float]:
-    """Helper returning latitude & longitude of ``target`` (degrees)."""
+    earth_at: Barycentric,
+    targets: Sequence[VectorFunction],
+    rotation: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Helper returning latitudes & longitudes of ``targets`` (degrees).
+
+    Apparent positions are stacked along a body axis (axis 1, after x/y/z) so
+    one rotation and one spherical conversion serve every target; results are
+    indexed by target along their first axis.
+    """
+
+    import numpy as np
+    from skyfield.functions import mxv, to_spherical
 
-    apparent = earth.at(time).observe(target).apparent()
-    lat_angle, lon_angle, _ = apparent.ecliptic_latlon(epoch=time)
-    return lat_angle.degrees, lon_angle.degrees
+    positions = np.stack(
+        [earth_at.observe(target).apparent().xyz.au for target in targets], axis=1
+    )
+    _, lat, lon = to_spherical(mxv(rotation, positions))
+    return np.degrees(lat), np.degrees(lon)
 
 
+@functools.lru_cache(maxsize=None)
 def _candidate_names(preferred: str) -> tuple[str, ...]:
     names = [preferred]
     for fallback in KERNEL_CANDIDATE_NAMES:
@@ -235,40 +539,187 @@ def _candidate_names(preferred: str) -> tuple[str, ...]:
 def _find_kernel_in_directory(
     directory: Path, candidates: Iterable[str]
 ) -> Optional[Path]:
+    # One directory listing instead of a stat() per candidate name.
+    try:
+        with os.scandir(directory) as entries:
+            present = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
     for name in candidates:
-        path = directory / name
-        if path.exists():
-            return path.resolve()
+        if name in present:
+            return (directory / name).resolve()
     return None
 
 
-def _download_kernel(url: str, destination: Path) -> None:
+def _download_kernel(
+    url: str, destination: Path, *, known_hash: Optional[str] = None
+) -> bool:
+    """Fetch ``url`` into ``destination``, retrying transient network errors.
+
+    Connection failures and 5xx responses are retried with exponential
+    backoff; 4xx responses fail immediately.
+
+    Concurrent callers (threads or processes) serialise on a lock file next to
+    ``destination``; whoever acquires it after a successful download finds the
+    kernel already in place and returns without touching the network.
+
+    Returns ``True`` if this call downloaded the kernel, ``False`` if it was
+    already present.
+    """
+
+    from time import sleep
+    from urllib.error import HTTPError, URLError
+
     destination.parent.mkdir(parents=True, exist_ok=True)
-    tmp_path: Optional[Path] = None
+    with _exclusive_lock(destination.with_suffix(".lock")):
+        if destination.is_file() and destination.stat().st_size > 0:
+            return False
+        last_error: Optional[URLError] = None
+        for attempt in range(DOWNLOAD_ATTEMPTS):
+            if attempt:
+                sleep(DOWNLOAD_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                _fetch_kernel(url, destination, known_hash)
+                return True
+            except HTTPError as exc:
+                if 400 <= exc.code < 500:
+                    # Client errors (404, 403, ...) will not go away on retry.
+                    raise KernelAcquisitionError(
+                        f"HTTP error {exc.code} while downloading {url}"
+                    ) from exc
+                last_error = exc
+            except URLError as exc:
+                last_error = exc
+    raise KernelAcquisitionError(
+        "No JPL kernel available locally and network download failed. "
+        "Please ensure internet connectivity or supply VEDIC_EPHEMERIS_PATH."
+    ) from last_error
+
+
+@contextlib.contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``lock_path`` for the ``with`` body."""
+
+    fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
     try:
-        with urlopen(url) as response:
+        if os.name == "nt":  # pragma: no cover - Windows only
+            import errno
+            import msvcrt
+
+            while True:
+                try:
+                    # LK_LOCK gives up after ~10 s; keep waiting for the holder.
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as exc:
+                    # Only contention is worth waiting out; anything else
+                    # (a bad descriptor, say) would fail the same way forever.
+                    if exc.errno not in (errno.EDEADLOCK, errno.EACCES):
+                        raise
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield  # Closing the descriptor releases the lock.
+    finally:
+        os.close(fd)
+
+
+def _fetch_kernel(url: str, destination: Path, known_hash: Optional[str]) -> None:
+    from urllib.error import URLError
+    from urllib.request import urlopen
+
+    # Only the lock holder writes here, so a fixed partial-download path is
+    # safe and avoids leaving a fresh randomly named temp file per attempt.
+    tmp_path = destination.with_name(destination.name + ".part")
+    try:
+        with _network_errors():
+            response = urlopen(url)
+        with response:
             if getattr(response, "status", 200) >= 400:
                 raise KernelAcquisitionError(
                     f"HTTP error {response.status} while downloading {url}"
                 )
-            with tempfile.NamedTemporaryFile(
-                delete=False, dir=str(destination.parent)
-            ) as tmp:
-                shutil.copyfileobj(response, tmp)
-                tmp_path = Path(tmp.name)
-        if tmp_path is None:
-            raise KernelAcquisitionError("Download failed: empty response.")
+            with tmp_path.open("wb") as tmp:
+                _stream_response(response, tmp)
+        if known_hash is not None:
+            _verify_checksum(tmp_path, known_hash, source=url)
         tmp_path.replace(destination)
-    except URLError as exc:
-        if tmp_path:
-            tmp_path.unlink(missing_ok=True)
-        raise KernelAcquisitionError(
-            "No JPL kernel available locally and network download failed. "
-            "Please ensure internet connectivity or supply VEDIC_EPHEMERIS_PATH."
-        ) from exc
+    except (KernelAcquisitionError, URLError):
+        tmp_path.unlink(missing_ok=True)
+        raise
     except OSError as exc:
-        if tmp_path:
-            tmp_path.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
         raise KernelAcquisitionError(
             f"Unable to store downloaded kernel at {destination}: {exc}"
         ) from exc
+
+
+def _stream_response(response: HTTPResponse, sink: BinaryIO) -> None:
+    """Copy ``response`` into ``sink`` with as few read/write calls as possible.
+
+    With a known ``Content-Length`` the body is read straight into one
+    pre-sized buffer and written in a single call; otherwise it is streamed
+    in :data:`DOWNLOAD_CHUNK_SIZE` blocks.  Read failures, including a body
+    shorter than its ``Content-Length``, surface as :class:`URLError`.
+    """
+
+    from urllib.error import URLError
+
+    length = int(response.headers.get("Content-Length") or 0)
+    if length <= 0:
+        while True:
+            with _network_errors():
+                block = response.read(DOWNLOAD_CHUNK_SIZE)
+            if not block:
+                return
+            sink.write(block)
+
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    offset = 0
+    while offset < length:
+        with _network_errors():
+            count = response.readinto(view[offset:])
+        if not count:
+            raise URLError(f"download truncated after {offset} of {length} bytes")
+        offset += count
+    sink.write(buffer)
+
+
+@contextlib.contextmanager
+def _network_errors() -> Iterator[None]:
+    """Report socket/HTTP failures in the body as :class:`URLError`.
+
+    Dropped connections, timeouts and short reads are then retried by
+    :func:`_download_kernel` like a failed connect, and are not mistaken for
+    local disk errors.
+    """
+
+    from http.client import HTTPException
+    from urllib.error import URLError
+
+    try:
+        yield
+    except URLError:
+        raise
+    except (OSError, HTTPException) as exc:
+        raise URLError(exc) from exc
+
+
+def _verify_checksum(path: Path, known_hash: str, *, source: str) -> None:
+    algorithm, _, expected = known_hash.partition(":")
+    digest = hashlib.new(algorithm)
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    if digest.hexdigest() != expected.lower():
+        raise KernelAcquisitionError(
+            f"Checksum mismatch for {source}: expected {known_hash}, "
+            f"got {algorithm}:{digest.hexdigest()}"
+        )
@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, Union
 
+import numpy as np
 from skyfield.api import Time
 
 __all__ = [
@@ -34,8 +35,12 @@ LAHIRI_C3 = 0.00000002 # degrees/century^3 (empirical refinement)
 class AyanamsaService(Protocol):
     """Protocol used by the computation core to request ayanamsa values."""
 
-    def lahiri(self, time: Time) -> float:
-        """Return Lahiri ayanamsa in degrees for the supplied TT instant."""
+    def lahiri(self, time: Time) -> Union[float, np.ndarray]:
+        """Return Lahiri ayanamsa in degrees for the supplied TT instant.
+
+        Batch callers pass an array-valued ``Time`` and expect an ``ndarray``
+        of the same shape back; a scalar ``Time`` yields a ``float``.
+        """
 
 
 @dataclass
@@ -49,11 +54,11 @@ class LahiriFallbackAyanamsaService:
     models (e.g., Swiss Ephemeris or IAU 2006 precession-nutation).
     """
 
-    def lahiri(self, time: Time) -> float:  # type: ignore[override]
+    def lahiri(self, time: Time) -> Union[float, np.ndarray]:
         return lahiri_mean_ayanamsa(time)
 
 
-def lahiri_mean_ayanamsa(time: Time) -> float:
+def lahiri_mean_ayanamsa(time: Time) -> Union[float, np.ndarray]:
     """Return the Lahiri ayanamsa (mean sidereal offset) in degrees.
 
     Parameters
@@ -61,7 +66,8 @@ def lahiri_mean_ayanamsa(time: Time) -> float:
     time:
         Skyfield ``Time`` instance measured in TT.  The polynomial below uses
         Julian centuries from 1900.0 TT, matching the canonical Lahiri
-        reference.  The result is wrapped to ``[0, 360)`` degrees.
+        reference.  The result is wrapped to ``[0, 360)`` degrees.  Array-valued
+        times are evaluated in one vectorised pass and return an ``ndarray``.
     """
 
     centuries = (time.tt - LAHIRI_REFERENCE_EPOCH_JD) / 36525.0
@@ -73,5 +79,8 @@ def lahiri_mean_ayanamsa(time: Time) -> float:
             + centuries * (LAHIRI_C2 - centuries * LAHIRI_C3)
         )
     )
+    if isinstance(ayanamsa, np.ndarray):
+        # np.mod follows the divisor's sign, so no negative fix-up is needed.
+        return np.mod(ayanamsa, 360.0)
     wrapped = math.fmod(ayanamsa, 360.0)
     return wrapped + 360.0 if wrapped < 0.0 else wrapped
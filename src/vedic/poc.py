@@ -13,6 +13,9 @@ that compares the ascendant against Parāśara's Light can be written as::
         result = compute_sample(dt, Location(35.6892, 51.3890))
         assert abs(result.ascendant.sidereal_deg - 207.8667) < 1.0
 
+Batch workloads should use :func:`compute_samples`, which evaluates many
+charts as NumPy arrays (structure-of-arrays) instead of one at a time.
+
 The focus here is numerical correctness (Meeus 1998; BPHS ch. 3) and clean
 integration hooks for future production services.
 """
@@ -20,22 +23,33 @@ integration hooks for future production services.
 from __future__ import annotations
 
 import argparse
-import math
+import functools
 import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable, Optional, Sequence
 
-from skyfield.api import Time
-
-from astro.ephemeris import KernelAcquisitionError, SkyfieldEphemeris
+import numpy as np
+
+from astro._angles import DEGREES_PER_CIRCLE, ascendant_degrees
+from astro._angles import wrap_degrees as _wrap_degrees
+from astro.ephemeris import (
+    KernelAcquisitionError,
+    NutationOfDate,
+    SkyfieldEphemeris,
+    get_default_ephemeris,
+    nutation_of_date,
+)
 from astro.sidereal import AyanamsaService, LahiriFallbackAyanamsaService
 
 __all__ = [
     "BodyLongitude",
+    "BodyLongitudeBatch",
     "Location",
     "VedicSample",
+    "VedicSampleBatch",
     "compute_sample",
+    "compute_samples",
     "format_dms",
     "main",
 ]
@@ -43,9 +57,7 @@ __all__ = [
 # ---------------------------------------------------------------------------
 # Fundamental constants (Meeus, *Astronomical Algorithms*, 2nd ed.)
 # ---------------------------------------------------------------------------
-DEGREES_PER_CIRCLE = 360.0
 DEGREES_PER_HOUR = 15.0
-TWO_PI = 2.0 * math.pi
 
 
 @dataclass(frozen=True)
@@ -64,6 +76,19 @@ class BodyLongitude:
     sidereal_deg: float
 
 
+@dataclass(frozen=True)
+class BodyLongitudeBatch:
+    """Aligned ``(N,)`` arrays of :class:`BodyLongitude` values."""
+
+    tropical_deg: np.ndarray
+    sidereal_deg: np.ndarray
+
+    def __getitem__(self, index: int) -> BodyLongitude:
+        return BodyLongitude(
+            float(self.tropical_deg[index]), float(self.sidereal_deg[index])
+        )
+
+
 @dataclass(frozen=True)
 class VedicSample:
     """Bundle of values emitted by the proof-of-concept pipeline."""
@@ -76,6 +101,38 @@ class VedicSample:
     ascendant: BodyLongitude
 
 
+@dataclass(frozen=True)
+class VedicSampleBatch:
+    """Structure-of-arrays counterpart of :class:`VedicSample` for N charts.
+
+    Every array has shape ``(N,)`` and row ``i`` describes the ``i``-th input
+    of :func:`compute_samples`; index the batch to get a :class:`VedicSample`.
+    """
+
+    timestamp_tt_jd: np.ndarray
+    latitude_deg: np.ndarray
+    longitude_deg: np.ndarray
+    ayanamsa_deg: np.ndarray
+    sun: BodyLongitudeBatch
+    moon: BodyLongitudeBatch
+    ascendant: BodyLongitudeBatch
+
+    def __len__(self) -> int:
+        return len(self.timestamp_tt_jd)
+
+    def __getitem__(self, index: int) -> VedicSample:
+        return VedicSample(
+            timestamp_tt_jd=float(self.timestamp_tt_jd[index]),
+            location=Location(
+                float(self.latitude_deg[index]), float(self.longitude_deg[index])
+            ),
+            ayanamsa_deg=float(self.ayanamsa_deg[index]),
+            sun=self.sun[index],
+            moon=self.moon[index],
+            ascendant=self.ascendant[index],
+        )
+
+
 def compute_sample(
     dt: datetime,
     location: Location,
@@ -93,26 +150,32 @@ def compute_sample(
     location:
         Observer position.
     ephemeris:
-        Optional Skyfield adapter.  A default instance is created otherwise.
+        Optional Skyfield adapter.  The shared default instance from
+        :func:`astro.ephemeris.get_default_ephemeris` is used otherwise.
     ayanamsa_service:
         Service that supplies Lahiri ayanamsa values.  Defaults to the
         polynomial fallback that mirrors BPHS/IAU 1976 precession.
     """
 
-    ephem = ephemeris or SkyfieldEphemeris()
-    ayanamsa_provider = ayanamsa_service or LahiriFallbackAyanamsaService()
+    ephem = ephemeris or get_default_ephemeris()
+    ayanamsa_provider = ayanamsa_service or _default_ayanamsa_service()
 
     ts_time = ephem.to_time(_ensure_timezone(dt))
-    true_obliquity = _true_obliquity_rad(ts_time)
+    nutation = nutation_of_date(ts_time)
     ayanamsa = ayanamsa_provider.lahiri(ts_time)
 
-    sun_tropical = _wrap_degrees(ephem.ecliptic_longitude("sun", ts_time))
-    moon_tropical = _wrap_degrees(ephem.ecliptic_longitude("moon", ts_time))
-    asc_tropical = _compute_ascendant(ts_time, location, true_obliquity)
+    longitudes = ephem.ecliptic_longitudes(
+        ("sun", "moon"), ts_time, nutation=nutation
+    )
+    # Ecliptic longitudes and the ascendant already lie in [0, 360); only the
+    # sidereal offsets need wrapping, and float ``%`` does it in one step.
+    sun_tropical = longitudes["sun"]
+    moon_tropical = longitudes["moon"]
+    asc_tropical = _compute_ascendant(location, nutation)
 
-    sun_sidereal = _wrap_degrees(sun_tropical - ayanamsa)
-    moon_sidereal = _wrap_degrees(moon_tropical - ayanamsa)
-    asc_sidereal = _wrap_degrees(asc_tropical - ayanamsa)
+    sun_sidereal = (sun_tropical - ayanamsa) % DEGREES_PER_CIRCLE
+    moon_sidereal = (moon_tropical - ayanamsa) % DEGREES_PER_CIRCLE
+    asc_sidereal = (asc_tropical - ayanamsa) % DEGREES_PER_CIRCLE
 
     return VedicSample(
         timestamp_tt_jd=ts_time.tt,
@@ -124,26 +187,105 @@ def compute_sample(
     )
 
 
-def _ensure_timezone(dt: datetime) -> datetime:
-    if dt.tzinfo is None:
-        raise ValueError("datetime must be timezone-aware to avoid UTC/TT drift")
-    return dt
-
+def compute_samples(
+    dts: Sequence[datetime],
+    lats: np.ndarray,
+    lons: np.ndarray,
+    *,
+    ephemeris: Optional[SkyfieldEphemeris] = None,
+    ayanamsa_service: Optional[AyanamsaService] = None,
+) -> VedicSampleBatch:
+    """Vectorised :func:`compute_sample` over many (timestamp, location) pairs.
 
-def _true_obliquity_rad(time: Time) -> float:
-    """Return the true obliquity of the ecliptic in radians.
+    Parameters
+    ----------
+    dts:
+        Timezone-aware timestamps (a sequence or object ``ndarray``).
+    lats, lons:
+        Observer latitudes and east-positive longitudes in degrees, aligned
+        with ``dts``.
+    ephemeris:
+        Optional Skyfield adapter; defaults to the shared instance.
+    ayanamsa_service:
+        Service supplying Lahiri ayanamsa values.  It receives an array-valued
+        ``Time`` and must return an array; the default fallback does.
 
-    Skyfield exposes the mean obliquity and nutation delta-epsilon following the
-    IAU 2000A series (see IERS Conventions 2010).  Their sum yields the true
-    obliquity required for the ascendant calculation.
+    All charts go through Skyfield as one array-valued ``Time``, so
+    observation, nutation and ayanamsa are each evaluated once for the whole
+    batch, and the ascendant runs in the compiled array kernels.
     """
 
-    mean_obliquity = time._mean_obliquity_radians  # Skyfield internal (rad).
-    _, delta_epsilon = time._nutation_angles_radians  # (Δψ, Δε) in radians.
-    return mean_obliquity + delta_epsilon
+    latitudes = np.ascontiguousarray(lats, dtype=float)
+    longitudes_deg = np.ascontiguousarray(lons, dtype=float)
+    if latitudes.ndim != 1 or latitudes.shape != longitudes_deg.shape:
+        raise ValueError("lats and lons must be 1-D arrays of equal length")
+    if len(dts) != latitudes.shape[0]:
+        raise ValueError("dts, lats and lons must have the same length")
+    if latitudes.shape[0] == 0:
+        empty = np.empty(0)
+        no_body = BodyLongitudeBatch(empty, empty)
+        return VedicSampleBatch(
+            timestamp_tt_jd=empty,
+            latitude_deg=latitudes,
+            longitude_deg=longitudes_deg,
+            ayanamsa_deg=empty,
+            sun=no_body,
+            moon=no_body,
+            ascendant=no_body,
+        )
+
+    # Imported here so single-chart callers never load Numba.
+    from astro._kernels import (
+        ascendant_array,
+        sidereal_offset_array,
+        wrap_degrees_array,
+    )
+
+    ephem = ephemeris or get_default_ephemeris()
+    ayanamsa_provider = ayanamsa_service or _default_ayanamsa_service()
+
+    ts_time = ephem.to_times(dts)
+    nutation = nutation_of_date(ts_time)
+    ayanamsa = np.ascontiguousarray(ayanamsa_provider.lahiri(ts_time), dtype=float)
+
+    longitudes = ephem.ecliptic_longitudes(
+        ("sun", "moon"), ts_time, nutation=nutation
+    )
+    lst_degrees = wrap_degrees_array(
+        nutation.gast_hours * DEGREES_PER_HOUR + longitudes_deg
+    )
+    asc_tropical = ascendant_array(
+        lst_degrees, latitudes, np.ascontiguousarray(nutation.true_obliquity_rad)
+    )
+
+    def body(tropical: np.ndarray) -> BodyLongitudeBatch:
+        return BodyLongitudeBatch(
+            tropical, sidereal_offset_array(tropical, ayanamsa)
+        )
+
+    return VedicSampleBatch(
+        timestamp_tt_jd=ts_time.tt,
+        latitude_deg=latitudes,
+        longitude_deg=longitudes_deg,
+        ayanamsa_deg=ayanamsa,
+        sun=body(longitudes["sun"]),
+        moon=body(longitudes["moon"]),
+        ascendant=body(asc_tropical),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _default_ayanamsa_service() -> AyanamsaService:
+    return LahiriFallbackAyanamsaService()
+
+
+def _ensure_timezone(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        raise ValueError("datetime must be timezone-aware to avoid UTC/TT drift")
+    return dt
 
 
-def _compute_ascendant(time: Time, location: Location, obliquity_rad: float) -> float:
+def _compute_ascendant(location: Location, nutation: NutationOfDate) -> float:
     """Compute the tropical ecliptic longitude of the ascendant (degrees).
 
     Formula based on Meeus (1998, ch. 12) & BPHS using local apparent sidereal
@@ -151,51 +293,42 @@ def _compute_ascendant(time: Time, location: Location, obliquity_rad: float) ->
 
         λasc = atan2(sin(LST)·cos ε − tan φ·sin ε, cos(LST))
 
-    Parameters are supplied in radians with longitude east-positive.
+    Both LST and ε come from the precomputed ``nutation`` so the IAU 2000A
+    series is not evaluated again.  Longitude is east-positive.
+    This is the single-chart path: it calls the plain-Python
+    :func:`astro._angles.ascendant_degrees` so that one chart never pays
+    Numba's import and JIT cost, while :func:`compute_samples` runs the
+    compiled build of that same function.
     """
 
-    lst_degrees = _local_sidereal_degrees(time, location.longitude_deg)
-    lst_rad = math.radians(lst_degrees)
-    latitude_rad = math.radians(location.latitude_deg)
-
-    numerator = math.sin(lst_rad) * math.cos(obliquity_rad) - math.tan(
-        latitude_rad
-    ) * math.sin(obliquity_rad)
-    denominator = math.cos(lst_rad)
-    ascendant_rad = math.atan2(numerator, denominator)
-    if ascendant_rad < 0.0:
-        ascendant_rad += TWO_PI
-    return _wrap_degrees(math.degrees(ascendant_rad))
+    return ascendant_degrees(
+        _local_sidereal_degrees(nutation, location.longitude_deg),
+        location.latitude_deg,
+        float(nutation.true_obliquity_rad),
+    )
 
 
-def _local_sidereal_degrees(time: Time, longitude_deg: float) -> float:
+def _local_sidereal_degrees(nutation: NutationOfDate, longitude_deg: float) -> float:
     """Return local apparent sidereal time in degrees at the observer's meridian."""
 
-    gast_hours = time.gast % 24.0
-    gst_degrees = gast_hours * DEGREES_PER_HOUR
+    gst_degrees = nutation.gast_hours * DEGREES_PER_HOUR
     return _wrap_degrees(gst_degrees + longitude_deg)
 
 
-def _wrap_degrees(angle: float) -> float:
-    wrapped = math.fmod(angle, DEGREES_PER_CIRCLE)
-    return wrapped + DEGREES_PER_CIRCLE if wrapped < 0.0 else wrapped
+def format_dms(angle: float, *, precision: int = 2) -> str:
+    """Format a degree value as D°M′S″ with configurable precision.
 
+    The angle is rounded once to an integer count of ``10**-precision``
+    arc-seconds; degrees, minutes and seconds then fall out of integer
+    ``divmod`` carries, so no roll-over correction is needed.
+    """
 
-def format_dms(angle: float, *, precision: int = 2) -> str:
-    """Format a degree value as D°M′S″ with configurable precision."""
-
-    wrapped = _wrap_degrees(angle)
-    degrees = int(wrapped)
-    minutes_total = (wrapped - degrees) * 60.0
-    minutes = int(minutes_total)
-    seconds = round((minutes_total - minutes) * 60.0, precision)
-
-    if seconds >= 60.0:
-        seconds -= 60.0
-        minutes += 1
-    if minutes >= 60:
-        minutes -= 60
-        degrees = (degrees + 1) % int(DEGREES_PER_CIRCLE)
+    scale = 10**precision
+    ticks = round((angle % DEGREES_PER_CIRCLE) * 3600.0 * scale)
+    ticks, second_ticks = divmod(ticks, 60 * scale)
+    degrees, minutes = divmod(ticks, 60)
+    degrees %= int(DEGREES_PER_CIRCLE)
+    seconds = second_ticks / scale
 
     return f"{degrees:03d}°{minutes:02d}′{seconds:0{4 + precision}.{precision}f}″"
 
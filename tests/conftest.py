@@ -0,0 +1,29 @@
+"""Shared pytest configuration.
+
+The ``astro``/``vedic`` wrappers at the repository root expose the code under
+``src``, so the root only has to be importable for ``pytest`` run from
+anywhere.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+
+@pytest.fixture(scope="session")
+def ephemeris():
+    """The shared default adapter, or a skip when no JPL kernel is reachable."""
+
+    from astro.ephemeris import KernelAcquisitionError, get_default_ephemeris
+
+    try:
+        return get_default_ephemeris()
+    except KernelAcquisitionError as exc:
+        pytest.skip(f"JPL kernel unavailable: {exc}")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import urllib.request
+from email.message import Message
+from urllib.error import HTTPError
+
+import pytest
+
+from astro import ephemeris
+from astro.ephemeris import KernelAcquisitionError
+
+URL = "https://example.invalid/de421.bsp"
+PAYLOAD = b"DAF/SPK kernel bytes" * 64
+PAYLOAD_HASH = "sha256:" + hashlib.sha256(PAYLOAD).hexdigest()
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal stand-in for the object returned by ``urlopen``."""
+
+    status = 200
+
+    def __init__(self, payload: bytes = PAYLOAD) -> None:
+        super().__init__(payload)
+        self.headers = {"Content-Length": str(len(payload))}
+
+
+class DroppedResponse(FakeResponse):
+    def readinto(self, buffer):
+        raise ConnectionResetError("connection reset by peer")
+
+
+def _http_error(code: int) -> HTTPError:
+    return HTTPError(URL, code, "error", Message(), None)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(ephemeris, "DOWNLOAD_BACKOFF_SECONDS", 0.0)
+
+
+@pytest.fixture
+def urlopen(monkeypatch):
+    """Replace ``urlopen`` with a script of responses/exceptions, one per call."""
+
+    calls = []
+
+    def install(*outcomes):
+        script = list(outcomes)
+
+        def fake_urlopen(url, *args, **kwargs):
+            calls.append(url)
+            outcome = script.pop(0)
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        return calls
+
+    return install
+
+
+def test_client_error_fails_without_retry(tmp_path, urlopen):
+    calls = urlopen(_http_error(404), FakeResponse())
+
+    with pytest.raises(KernelAcquisitionError, match="404"):
+        ephemeris._download_kernel(URL, tmp_path / "de421.bsp")
+    assert len(calls) == 1
+
+
+def test_server_error_is_retried(tmp_path, urlopen):
+    destination = tmp_path / "de421.bsp"
+    calls = urlopen(_http_error(503), _http_error(502), FakeResponse())
+
+    assert ephemeris._download_kernel(URL, destination, known_hash=PAYLOAD_HASH)
+    assert len(calls) == 3
+    assert destination.read_bytes() == PAYLOAD
+
+
+def test_server_error_gives_up_after_all_attempts(tmp_path, urlopen):
+    calls = urlopen(*[_http_error(500)] * ephemeris.DOWNLOAD_ATTEMPTS)
+
+    with pytest.raises(KernelAcquisitionError):
+        ephemeris._download_kernel(URL, tmp_path / "de421.bsp")
+    assert len(calls) == ephemeris.DOWNLOAD_ATTEMPTS
+
+
+def test_dropped_connection_while_reading_is_retried(tmp_path, urlopen):
+    destination = tmp_path / "de421.bsp"
+    calls = urlopen(DroppedResponse(), FakeResponse())
+
+    assert ephemeris._download_kernel(URL, destination)
+    assert len(calls) == 2
+    assert destination.read_bytes() == PAYLOAD
+
+
+def test_checksum_mismatch_removes_partial_file(tmp_path, urlopen):
+    destination = tmp_path / "de421.bsp"
+    urlopen(FakeResponse(b"corrupted"))
+
+    with pytest.raises(KernelAcquisitionError, match="Checksum mismatch"):
+        ephemeris._download_kernel(URL, destination, known_hash=PAYLOAD_HASH)
+    assert not destination.exists()
+    assert not destination.with_name(destination.name + ".part").exists()
+
+
+def test_existing_kernel_found_under_lock_is_not_downloaded(tmp_path, urlopen):
+    destination = tmp_path / "de421.bsp"
+    destination.write_bytes(PAYLOAD)
+    calls = urlopen()
+
+    assert ephemeris._download_kernel(URL, destination) is False
+    assert calls == []
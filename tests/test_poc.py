@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from vedic.poc import Location, VedicSample, compute_sample, compute_samples
+
+CHARTS = [
+    (datetime(1997, 6, 7, 20, 28, tzinfo=timezone(timedelta(hours=3.5))), 35.6892, 51.3890),
+    (datetime(1979, 10, 12, 4, 30, tzinfo=timezone.utc), 35.6892, 51.3890),
+    (datetime(2024, 2, 29, 23, 59, tzinfo=timezone(timedelta(hours=-5))), -33.8688, -70.6693),
+    (datetime(1900, 1, 1, 0, 0, tzinfo=timezone.utc), 64.1466, -21.9426),
+    (datetime(2050, 12, 31, 12, 0, tzinfo=timezone(timedelta(hours=9))), 0.0, 179.9),
+]
+
+
+def _assert_samples_close(batch_row: VedicSample, single: VedicSample) -> None:
+    assert batch_row.timestamp_tt_jd == pytest.approx(single.timestamp_tt_jd, abs=1e-9)
+    assert batch_row.location == single.location
+    assert batch_row.ayanamsa_deg == pytest.approx(single.ayanamsa_deg, abs=1e-9)
+    for name in ("sun", "moon", "ascendant"):
+        row, expected = getattr(batch_row, name), getattr(single, name)
+        assert row.tropical_deg == pytest.approx(expected.tropical_deg, abs=1e-9)
+        assert row.sidereal_deg == pytest.approx(expected.sidereal_deg, abs=1e-9)
+
+
+@pytest.mark.parametrize("count", [1, len(CHARTS)])
+def test_compute_samples_matches_compute_sample(ephemeris, count):
+    dts, lats, lons = zip(*CHARTS[:count])
+    batch = compute_samples(dts, np.array(lats), np.array(lons), ephemeris=ephemeris)
+
+    assert len(batch) == count
+    for i, (dt, lat, lon) in enumerate(CHARTS[:count]):
+        single = compute_sample(dt, Location(lat, lon), ephemeris=ephemeris)
+        _assert_samples_close(batch[i], single)
+
+
+def test_compute_samples_empty_batch(ephemeris):
+    batch = compute_samples([], np.array([]), np.array([]), ephemeris=ephemeris)
+
+    assert len(batch) == 0
+    for body in (batch.sun, batch.moon, batch.ascendant):
+        assert body.tropical_deg.shape == (0,)
+        assert body.sidereal_deg.shape == (0,)
+
+
+def test_compute_samples_rejects_misaligned_inputs():
+    dt = CHARTS[0][0]
+    with pytest.raises(ValueError):
+        compute_samples([dt], np.array([1.0, 2.0]), np.array([1.0]))
+    with pytest.raises(ValueError):
+        compute_samples([dt, dt], np.array([1.0]), np.array([1.0]))